@@ -7,28 +7,186 @@ Usage:
     python pdf_to_json.py --input recipe-pdfs/ --output public/recipes.json
 """
 
+import hashlib
+import io
+import mmap
 import os
 import re
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
 try:
-    from PyPDF2 import PdfReader
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ijson
 except ImportError:
-    print("ERROR: PyPDF2 not installed. Please run:")
+    ijson = None
+
+
+@contextmanager
+def _mapped_pdf(pdf_path: str) -> Iterator[mmap.mmap]:
+    """Memory-map a PDF read-only, so pages come from the OS page cache on
+    demand rather than being copied through Python file buffers."""
+    with open(pdf_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield mm
+
+
+def _pypdfium2_backend() -> Callable[[str], str]:
+    import pypdfium2 as pdfium
+    
+    def extract(pdf_path: str) -> str:
+        # pdfium does its own native file I/O, so it gets the path
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            text = "\n".join(page.get_textpage().get_text_range() for page in pdf)
+        finally:
+            pdf.close()
+        # pdfium ends lines with \r\n; the section parsers expect \n
+        return text.replace('\r\n', '\n')
+    
+    return extract
+
+
+def _pdftotext_backend() -> Callable[[str], str]:
+    import pdftotext
+    
+    def extract(pdf_path: str) -> str:
+        with _mapped_pdf(pdf_path) as mm:
+            # raw=True keeps content-stream order, like PyPDF2
+            return "\n".join(pdftotext.PDF(mm, raw=True))
+    
+    return extract
+
+
+def _pymupdf_backend() -> Callable[[str], str]:
+    import fitz  # PyMuPDF
+    
+    def extract(pdf_path: str) -> str:
+        with fitz.open(pdf_path) as doc:
+            return "\n".join(page.get_text() for page in doc)
+    
+    return extract
+
+
+def _pypdf2_backend() -> Callable[[str], str]:
+    from PyPDF2 import PdfReader
+    
+    def extract(pdf_path: str) -> str:
+        with _mapped_pdf(pdf_path) as mm:
+            # PyPDF2 reads pages lazily, so extract while the map is open
+            reader = PdfReader(mm)
+            # Pages with no text layer return None
+            return "\n".join(page.extract_text() or "" for page in reader.pages) + "\n"
+    
+    return extract
+
+
+# Text extraction backends, fastest first; the first one installed is used
+_PDF_BACKENDS = [
+    ('pypdfium2', _pypdfium2_backend),
+    ('pdftotext', _pdftotext_backend),
+    ('pymupdf', _pymupdf_backend),
+    ('PyPDF2', _pypdf2_backend),
+]
+
+
+def _select_pdf_backend() -> Tuple[Optional[str], Optional[Callable[[str], str]]]:
+    """Return the name and extract function of the first installed backend."""
+    for name, load in _PDF_BACKENDS:
+        try:
+            return name, load()
+        except ImportError:
+            continue
+    return None, None
+
+
+PDF_BACKEND, _extract_text = _select_pdf_backend()
+if _extract_text is None:
+    print("ERROR: No PDF library installed. Please run one of:")
+    print("  pip install pypdfium2 --break-system-packages   (fastest)")
+    print("  pip install pdftotext --break-system-packages   (requires poppler)")
+    print("  pip install pymupdf --break-system-packages")
     print("  pip install PyPDF2 --break-system-packages")
     exit(1)
 
+# Patterns are compiled once at import; the parsers run them for every PDF.
+_ID_NONWORD = re.compile(r'[^\w\s-]')
+_TIME_RE = re.compile(r'(\d+)\s*minutes')
+_SERV_RE = re.compile(r'(\d+)\s*servings?')
+# A line of 21+ characters (once stripped) followed by a line mentioning
+# both minutes and servings, e.g. "30 minutes | 2 servings"
+_TITLE_RE = re.compile(
+    r'^[^\S\n]*(?!Find cookware)(\S[^\n]{19,}\S)[^\S\n]*\n'
+    r'(?=[^\n]*minutes)(?=[^\n]*servings)([^\n]*)',
+    re.MULTILINE
+)
+_OPTIONAL_RE = re.compile(r'\s*\(optional\)')
+# Section lines with 3+ characters once stripped, skipping the section header
+_COOKWARE_LINE_RE = re.compile(r'^[^\S\n]*(?!Find)(\S[^\n]+\S)[^\S\n]*$', re.MULTILINE)
+_INGREDIENT_LINE_RE = re.compile(r'^[^\S\n]*(?!Grab)(\S[^\n]+\S)[^\S\n]*$', re.MULTILINE)
+# Common patterns: "1 cup flour", "2 medium carrots", "1 (15 oz) can beans"
+_QTY_UNITS = r'cup|tbsp|tsp|fl\s*oz|oz|lb|pkg|can|bunch|stick|clove|medium|small|large'
+try:
+    # No two units match at the same spot, so an atomic group (Python 3.11+)
+    # only stops the engine from retrying the other units after one matched
+    _QTY_RE = re.compile(r'^([\d\/\.\s]+(?:\([^)]+\))?\s*(?>' + _QTY_UNITS + r')?s?)\s+(.+)$')
+except re.error:
+    _QTY_RE = re.compile(r'^([\d\/\.\s]+(?:\([^)]+\))?\s*(?:' + _QTY_UNITS + r')?s?)\s+(.+)$')
+_PAGE_FOOTER_RE = re.compile(r'\n\d+\sof\s\d+')
+# A line holding only a step number, followed by every line up to the next one
+_STEP_BLOCK_RE = re.compile(
+    r'^[^\S\n]*(\d+)[^\S\n]*$((?:\n(?![^\S\n]*\d+[^\S\n]*$)[^\n]*)*)',
+    re.MULTILINE
+)
+# A line break plus any whitespace (and blank lines) around it
+_LINE_BREAK_RE = re.compile(r'[^\S\n]*\n\s*')
+
+
+def dump_json(data: Any, pretty: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    indent = 2 if pretty else None
+    separators = None if pretty else (',', ':')
+    return json.dumps(data, indent=indent, separators=separators, ensure_ascii=False).encode('utf-8')
+
+
+def load_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it's installed."""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_recipes(json_file: str) -> Iterator[Dict[str, Any]]:
+    """Yield each recipe in a recipes JSON file.
+    
+    With ijson installed the file is streamed one recipe at a time, so
+    memory stays flat no matter how many recipes it holds.
+    """
+    if ijson is not None:
+        with open(json_file, 'rb') as f:
+            yield from ijson.items(f, 'recipes.item')
+    else:
+        yield from load_json(json_file).get('recipes', [])
+
+
+# json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
+_JSON_ERRORS = (ValueError, ijson.JSONError) if ijson is not None else (ValueError,)
+
 
 def extract_text_from_pdf(pdf_path: str) -> str:
-    """Extract all text from a PDF file."""
+    """Extract all text from a PDF file using the selected PDF_BACKEND."""
     try:
-        reader = PdfReader(pdf_path)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        return _extract_text(pdf_path)
     except Exception as e:
         print(f"Error reading {pdf_path}: {e}")
         return ""
@@ -36,39 +194,30 @@ def extract_text_from_pdf(pdf_path: str) -> str:
 
 def generate_recipe_id(title: str) -> str:
     """Generate a URL-safe ID from recipe title."""
-    # Convert to lowercase, replace special chars with hyphens
-    recipe_id = re.sub(r'[^\w\s-]', '', title.lower())
-    recipe_id = re.sub(r'[-\s]+', '-', recipe_id)
-    return recipe_id.strip('-')
+    # Convert to lowercase and drop special chars, then join the words with
+    # single hyphens; split() also trims any leading/trailing separators
+    recipe_id = _ID_NONWORD.sub('', title.lower())
+    return '-'.join(recipe_id.replace('-', ' ').split())
 
 
 def parse_title_and_metadata(text: str) -> Dict[str, Any]:
     """Extract recipe title, cook time, and servings."""
-    lines = text.split('\n')
-    
-    # Find the title (usually the first substantial line)
     title = None
     cook_time = None
     servings = None
     
-    for i, line in enumerate(lines):
-        line = line.strip()
-        
-        # Title is usually before the time/servings line
-        if not title and len(line) > 20 and not line.startswith('Find cookware'):
-            # Check if next line has time/servings
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if 'minutes' in next_line and 'servings' in next_line:
-                    title = line
-                    # Parse time and servings from next line
-                    time_match = re.search(r'(\d+)\s*minutes', next_line)
-                    servings_match = re.search(r'(\d+)\s*servings?', next_line)
-                    if time_match:
-                        cook_time = f"{time_match.group(1)} minutes"
-                    if servings_match:
-                        servings = int(servings_match.group(1))
-                    break
+    # Title is the first substantial line directly above the time/servings line
+    title_match = _TITLE_RE.search(text)
+    if title_match:
+        title = title_match.group(1)
+        # Parse time and servings from next line
+        next_line = title_match.group(2)
+        time_match = _TIME_RE.search(next_line)
+        servings_match = _SERV_RE.search(next_line)
+        if time_match:
+            cook_time = f"{time_match.group(1)} minutes"
+        if servings_match:
+            servings = int(servings_match.group(1))
     
     return {
         'title': title or 'Unknown Recipe',
@@ -77,56 +226,70 @@ def parse_title_and_metadata(text: str) -> Dict[str, Any]:
     }
 
 
-def parse_cookware(text: str) -> List[str]:
-    """Extract cookware list from 'Find cookware' section."""
+def _split_sections(text: str) -> Tuple[str, str, str, str]:
+    """Split PDF text into header, cookware, ingredients and instructions.
+    
+    Walks the text once, starting each marker search where the previous
+    section ended. Sections that can't be found come back empty.
+    """
+    header, cookware, ingredients, instructions = text, '', '', ''
+    pos = 0
+    
+    # Cookware: between 'Find cookware' and 'Grab ingredients'
+    start = text.find('Find cookware\n')
+    if start != -1:
+        body_start = start + len('Find cookware\n')
+        end = text.find('\nGrab ingredients', body_start)
+        if end != -1:
+            header = text[:start]
+            cookware = text[body_start:end]
+            pos = end
+    
+    # Ingredients: up to 'Cook & enjoy' (or end of text)
+    start = text.find('Grab ingredients\n', pos)
+    if start != -1:
+        body_start = start + len('Grab ingredients\n')
+        end = text.find('\nCook & enjoy', body_start)
+        if end == -1:
+            end = len(text)
+        ingredients = text[body_start:end]
+        pos = end
+    
+    # Instructions: up to the "1 of 2" page footer (or end of text)
+    start = text.find('Cook & enjoy\n', pos)
+    if start != -1:
+        body_start = start + len('Cook & enjoy\n')
+        footer = _PAGE_FOOTER_RE.search(text, body_start)
+        instructions = text[body_start:footer.start() if footer else len(text)]
+    
+    return header, cookware, ingredients, instructions
+
+
+def parse_cookware(cookware_text: str) -> List[str]:
+    """Extract cookware list from the 'Find cookware' section body."""
     cookware = []
     
-    # Find the cookware section
-    cookware_match = re.search(r'Find cookware\n(.*?)\nGrab ingredients', text, re.DOTALL)
-    if not cookware_match:
-        return cookware
-    
-    cookware_text = cookware_match.group(1)
-    
-    # Split by newlines and clean up
-    items = cookware_text.split('\n')
-    for item in items:
-        item = item.strip()
-        if item and not item.startswith('Find') and len(item) > 2:
-            # Remove optional markers
-            item = re.sub(r'\s*\(optional\)', '', item)
-            cookware.append(item)
+    # Each match is one stripped, non-trivial line
+    for match in _COOKWARE_LINE_RE.finditer(cookware_text):
+        # Remove optional markers
+        cookware.append(_OPTIONAL_RE.sub('', match.group(1)))
     
     return cookware
 
 
-def parse_ingredients(text: str) -> List[Dict[str, str]]:
-    """Extract ingredients from 'Grab ingredients' section."""
+def parse_ingredients(ingredients_text: str) -> List[Dict[str, str]]:
+    """Extract ingredients from the 'Grab ingredients' section body."""
     ingredients = []
     
-    # Find the ingredients section
-    ingredients_match = re.search(r'Grab ingredients\n(.*?)\n(?:Cook & enjoy|$)', text, re.DOTALL)
-    if not ingredients_match:
-        return ingredients
-    
-    ingredients_text = ingredients_match.group(1)
-    
-    # Split by newlines
-    lines = ingredients_text.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        
-        # Skip empty lines and section headers
-        if not line or line.startswith('Grab') or len(line) < 3:
-            continue
+    # Each match is one stripped line, skipping empty lines and section headers
+    for match in _INGREDIENT_LINE_RE.finditer(ingredients_text):
+        line = match.group(1)
         
         # Categorize ingredient (simple heuristic)
         category = categorize_ingredient(line)
         
         # Parse quantity and name
-        # Common patterns: "1 cup flour", "2 medium carrots", "1 (15 oz) can beans"
-        quantity_match = re.match(r'^([\d\/\.\s]+(?:\([^)]+\))?\s*(?:cup|tbsp|tsp|oz|lb|fl oz|pkg|can|bunch|stick|clove|medium|small|large)?s?)\s+(.+)$', line)
+        quantity_match = _QTY_RE.match(line)
         
         if quantity_match:
             quantity = quantity_match.group(1).strip()
@@ -146,85 +309,74 @@ def parse_ingredients(text: str) -> List[Dict[str, str]]:
     return ingredients
 
 
+# Ingredient keywords by category
+_PRODUCE = frozenset({'carrot', 'celery', 'onion', 'garlic', 'tomato',
+                      'pepper', 'kale', 'lettuce', 'spinach', 'bean',
+                      'apple', 'kiwi', 'berry', 'fruit', 'lime', 'lemon'})
+_PROTEIN = frozenset({'chicken', 'beef', 'pork', 'fish', 'turkey',
+                      'salmon', 'tuna', 'shrimp', 'tofu'})
+_DAIRY = frozenset({'milk', 'cheese', 'yogurt', 'butter', 'cream',
+                    'cheddar', 'mozzarella', 'parmesan'})
+_SPICES = frozenset({'salt', 'pepper', 'cumin', 'paprika', 'oregano',
+                     'basil', 'thyme', 'cinnamon', 'turmeric',
+                     'chili powder', 'italian seasoning'})
+
+# Categories in priority order: an ingredient gets the first category with a
+# keyword appearing anywhere in it ('carrots', 'salt and pepper' -> produce),
+# so keywords are matched as substrings rather than looked up per token.
+_CATEGORY_KEYWORDS = {
+    'produce': _PRODUCE,
+    'protein': _PROTEIN,
+    'dairy': _DAIRY,
+    'spices': _SPICES,
+}
+
+# Keyword -> category rank; a keyword listed twice keeps its higher-priority category
+_CATEGORY_NAMES = list(_CATEGORY_KEYWORDS)
+_KEYWORD_RANK = {}
+for _rank, _words in enumerate(_CATEGORY_KEYWORDS.values()):
+    for _word in _words:
+        _KEYWORD_RANK.setdefault(_word, _rank)
+
+# One alternation over every keyword (highest priority first), wrapped in a
+# lookahead so overlapping matches are all reported in a single scan
+_CATEGORY_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(w) for w in sorted(_KEYWORD_RANK, key=lambda w: (_KEYWORD_RANK[w], w))) + '))'
+)
+
+
+@lru_cache(maxsize=4096)
 def categorize_ingredient(ingredient: str) -> str:
-    """Categorize ingredient based on common patterns."""
-    ingredient_lower = ingredient.lower()
-    
-    # Produce
-    if any(word in ingredient_lower for word in ['carrot', 'celery', 'onion', 'garlic', 'tomato', 
-                                                   'pepper', 'kale', 'lettuce', 'spinach', 'bean',
-                                                   'apple', 'kiwi', 'berry', 'fruit', 'lime', 'lemon']):
-        return 'produce'
-    
-    # Protein
-    if any(word in ingredient_lower for word in ['chicken', 'beef', 'pork', 'fish', 'turkey', 
-                                                   'salmon', 'tuna', 'shrimp', 'tofu']):
-        return 'protein'
-    
-    # Dairy
-    if any(word in ingredient_lower for word in ['milk', 'cheese', 'yogurt', 'butter', 'cream', 
-                                                   'cheddar', 'mozzarella', 'parmesan']):
-        return 'dairy'
-    
-    # Spices
-    if any(word in ingredient_lower for word in ['salt', 'pepper', 'cumin', 'paprika', 'oregano',
-                                                   'basil', 'thyme', 'cinnamon', 'turmeric', 
-                                                   'chili powder', 'italian seasoning']):
-        return 'spices'
+    """Categorize ingredient based on common patterns.
+    
+    Memoized: the same ingredient lines ("1 clove garlic", "salt") recur
+    across recipes, and each worker process keeps its own cache.
+    """
+    best = len(_CATEGORY_NAMES)
+    
+    for match in _CATEGORY_RE.finditer(ingredient.lower()):
+        best = min(best, _KEYWORD_RANK[match.group(1)])
+        if best == 0:
+            break
     
     # Default to pantry
-    return 'pantry'
+    return _CATEGORY_NAMES[best] if best < len(_CATEGORY_NAMES) else 'pantry'
 
 
-def parse_instructions(text: str) -> List[Dict[str, Any]]:
-    """Extract cooking instructions from 'Cook & enjoy' section."""
+def parse_instructions(instructions_text: str) -> List[Dict[str, Any]]:
+    """Extract cooking instructions from the 'Cook & enjoy' section body."""
     instructions = []
     
-    # Find the instructions section
-    instructions_match = re.search(r'Cook & enjoy\n(.*?)(?:\n\d+\sof\s\d+|$)', text, re.DOTALL)
-    if not instructions_match:
-        return instructions
-    
-    instructions_text = instructions_match.group(1)
-    
-    # Split by numbered steps
-    # Pattern: line starts with a number (1, 2, 3, etc.)
-    lines = instructions_text.split('\n')
-    
-    current_step = None
-    current_text = []
-    
-    for line in lines:
-        line = line.strip()
-        
-        if not line:
-            continue
-        
-        # Check if line starts with a step number
-        step_match = re.match(r'^(\d+)\s*$', line)
-        
-        if step_match:
-            # Save previous step
-            if current_step is not None and current_text:
-                instructions.append({
-                    'step': current_step,
-                    'text': ' '.join(current_text).strip()
-                })
-            
-            # Start new step
-            current_step = int(step_match.group(1))
-            current_text = []
-        else:
-            # Add to current step text
-            if current_step is not None:
-                current_text.append(line)
-    
-    # Save last step
-    if current_step is not None and current_text:
-        instructions.append({
-            'step': current_step,
-            'text': ' '.join(current_text).strip()
-        })
+    # Each match is a step number line (1, 2, 3, etc.) and the text below it;
+    # anything before the first step number is skipped
+    for match in _STEP_BLOCK_RE.finditer(instructions_text):
+        # Join the step's lines with single spaces, dropping blank lines
+        text = _LINE_BREAK_RE.sub(' ', match.group(2).strip())
+        if text:
+            instructions.append({
+                'step': int(match.group(1)),
+                'text': text
+            })
     
     return instructions
 
@@ -235,15 +387,16 @@ def parse_recipe_pdf(pdf_path: str) -> Dict[str, Any]:
     
     text = extract_text_from_pdf(pdf_path)
     
-    if not text:
+    if not text.strip():
         print(f"  ⚠️  Warning: Could not extract text from {pdf_path}")
         return None
     
     # Extract all components
+    _, cookware_text, ingredients_text, instructions_text = _split_sections(text)
     metadata = parse_title_and_metadata(text)
-    cookware = parse_cookware(text)
-    ingredients = parse_ingredients(text)
-    instructions = parse_instructions(text)
+    cookware = parse_cookware(cookware_text)
+    ingredients = parse_ingredients(ingredients_text)
+    instructions = parse_instructions(instructions_text)
     
     # Validate we got the essentials
     if not ingredients or not instructions:
@@ -266,7 +419,100 @@ def parse_recipe_pdf(pdf_path: str) -> Dict[str, Any]:
     return recipe
 
 
-def process_directory(input_dir: str, output_file: str):
+def write_recipes_json(output_path: Path, recipes: Iterable[Dict[str, Any]],
+                       metadata: Dict[str, Any]) -> int:
+    """Write recipes.json one recipe at a time and return the recipe count.
+    
+    The bytes match dump_json({'recipes': [...], 'metadata': {'total': ...}})
+    but only one recipe is held at a time. Output goes to a temporary file
+    that replaces output_path at the end, so a failed run keeps the old file.
+    """
+    total = 0
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(b'{\n  "recipes": [')
+            for recipe in recipes:
+                # Nest each object by re-indenting its lines; JSON strings
+                # never contain raw newlines, so this only touches layout
+                f.write(b',\n    ' if total else b'\n    ')
+                f.write(dump_json(recipe).replace(b'\n', b'\n    '))
+                total += 1
+            f.write(b'\n  ],\n  "metadata": ' if total else b'],\n  "metadata": ')
+            f.write(dump_json({'total': total, **metadata}).replace(b'\n', b'\n  '))
+            f.write(b'\n}')
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+    
+    return total
+
+
+def _parse_recipe_worker(pdf_path: str) -> Tuple[Optional[Dict[str, Any]], str]:
+    """Run parse_recipe_pdf in a worker process, buffering its console output.
+    
+    Output is returned with the recipe so the parent can print each file's
+    messages together instead of interleaving them across workers.
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        recipe = parse_recipe_pdf(pdf_path)
+    return recipe, buffer.getvalue()
+
+
+# Parsed recipes are cached next to the PDFs so unchanged files aren't reparsed
+CACHE_FILENAME = '.pdf2json_cache.json'
+
+
+def _cache_version() -> str:
+    """Identify the parser build; cached recipes from any other build are stale."""
+    source_hash = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+    return f"{PDF_BACKEND}:{source_hash}"
+
+
+def _file_cache_key(pdf_file: os.DirEntry) -> str:
+    """Cheap change detector for a PDF: size and modification time."""
+    stat = pdf_file.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def load_cache(cache_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load cached recipes, ignoring caches that are unreadable or stale."""
+    try:
+        cache = load_json(cache_path)
+    except (OSError, ValueError):
+        return {}
+    
+    if not isinstance(cache, dict) or cache.get('version') != _cache_version():
+        return {}
+    return cache.get('files', {})
+
+
+def save_cache(cache_path: Path, entries: Dict[str, Dict[str, Any]]):
+    """Write cached recipes; a cache that can't be written is only a warning."""
+    try:
+        cache_path.write_bytes(dump_json({'version': _cache_version(), 'files': entries}, pretty=False))
+    except OSError as e:
+        print(f"  ⚠️  Warning: Could not write cache {cache_path}: {e}")
+
+
+def iter_pdfs(directory: Path) -> Iterator[os.DirEntry]:
+    """Yield the PDF files in a directory, sorted by name.
+    
+    scandir reports entry types from the directory listing itself, so
+    unlike glob no per-file stat is needed just to find the PDFs.
+    """
+    with os.scandir(directory) as it:
+        yield from sorted((entry for entry in it
+                           if entry.name.endswith('.pdf') and entry.is_file()),
+                          key=lambda entry: entry.name)
+
+
+def process_directory(input_dir: str, output_file: str, workers: Optional[int] = None,
+                      use_cache: bool = True):
     """Process all PDF files in a directory and create JSON output."""
     input_path = Path(input_dir)
     
@@ -275,49 +521,75 @@ def process_directory(input_dir: str, output_file: str):
         return
     
     # Find all PDF files
-    pdf_files = list(input_path.glob('*.pdf'))
+    pdf_files = list(iter_pdfs(input_path))
     
     if not pdf_files:
         print(f"ERROR: No PDF files found in '{input_dir}'")
         return
     
-    print(f"\nFound {len(pdf_files)} PDF files")
+    print(f"\nFound {len(pdf_files)} PDF files (extracting with {PDF_BACKEND})")
     print("=" * 60)
     
-    recipes = []
-    failed = []
+    # Reuse recipes for PDFs that haven't changed since the last run
+    cache_path = input_path / CACHE_FILENAME
+    cache = load_cache(cache_path) if use_cache else {}
+    new_cache = {}
+    cached = {}
+    keys = {}
+    
+    for pdf_file in pdf_files:
+        key = _file_cache_key(pdf_file)
+        entry = cache.get(pdf_file.name)
+        if entry and entry.get('key') == key:
+            cached[pdf_file] = entry['recipe']
+            new_cache[pdf_file.name] = entry
+        else:
+            keys[pdf_file] = key
     
-    for pdf_file in sorted(pdf_files):
-        try:
-            recipe = parse_recipe_pdf(str(pdf_file))
-            if recipe:
-                recipes.append(recipe)
-            else:
-                failed.append(pdf_file.name)
-        except Exception as e:
-            print(f"  ❌ Error processing {pdf_file.name}: {e}")
-            failed.append(pdf_file.name)
-    
-    # Create output
-    output_data = {
-        'recipes': recipes,
-        'metadata': {
-            'total': len(recipes),
-            'generated': 'Generated by pdf_to_json.py',
-            'source': input_dir
-        }
-    }
+    if cached:
+        print(f"♻️  Reusing {len(cached)} cached recipes")
     
-    # Write JSON
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    failed = []
+    
+    # PDFs are independent, so parse them in parallel. Results are taken in
+    # sorted order to keep the output stable, and each recipe is written out
+    # as soon as it's reached while the workers carry on with the rest.
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {pdf_file: executor.submit(_parse_recipe_worker, pdf_file.path)
+                   for pdf_file in keys}
+        
+        def recipes_in_order():
+            for pdf_file in pdf_files:
+                if pdf_file in cached:
+                    recipe = cached.pop(pdf_file)
+                else:
+                    try:
+                        recipe, log = futures.pop(pdf_file).result()
+                        print(log, end='')
+                    except Exception as e:
+                        print(f"  ❌ Error processing {pdf_file.name}: {e}")
+                        recipe = None
+                    if recipe:
+                        new_cache[pdf_file.name] = {'key': keys[pdf_file], 'recipe': recipe}
+                
+                if recipe:
+                    yield recipe
+                else:
+                    failed.append(pdf_file.name)
+        
+        total = write_recipes_json(output_path, recipes_in_order(), {
+            'generated': 'Generated by pdf_to_json.py',
+            'source': input_dir
+        })
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    if use_cache:
+        save_cache(cache_path, new_cache)
     
     # Summary
     print("\n" + "=" * 60)
-    print(f"✓ Successfully processed: {len(recipes)} recipes")
+    print(f"✓ Successfully processed: {total} recipes")
     if failed:
         print(f"❌ Failed: {len(failed)} recipes")
         for name in failed:
@@ -331,16 +603,18 @@ def validate_json(json_file: str):
     print(f"\nValidating {json_file}...")
     
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        recipes = data.get('recipes', [])
-        
-        print(f"✓ Valid JSON with {len(recipes)} recipes")
-        
-        # Check for required fields
+        # Tally everything in a single pass over the recipes
+        total = 0
+        total_ingredients = 0
+        total_steps = 0
         issues = []
-        for i, recipe in enumerate(recipes):
+        
+        for i, recipe in enumerate(iter_recipes(json_file)):
+            total += 1
+            total_ingredients += len(recipe.get('ingredients', []))
+            total_steps += len(recipe.get('instructions', []))
+            
+            # Check for required fields
             missing = []
             if not recipe.get('title'):
                 missing.append('title')
@@ -352,6 +626,8 @@ def validate_json(json_file: str):
             if missing:
                 issues.append(f"Recipe {i+1} ({recipe.get('id', 'unknown')}): missing {', '.join(missing)}")
         
+        print(f"✓ Valid JSON with {total} recipes")
+        
         if issues:
             print("\n⚠️  Validation warnings:")
             for issue in issues[:10]:  # Show first 10
@@ -362,17 +638,14 @@ def validate_json(json_file: str):
             print("✓ All recipes have required fields")
         
         # Statistics
-        total_ingredients = sum(len(r.get('ingredients', [])) for r in recipes)
-        total_steps = sum(len(r.get('instructions', [])) for r in recipes)
-        
         print(f"\nStatistics:")
-        print(f"  Total recipes: {len(recipes)}")
+        print(f"  Total recipes: {total}")
         print(f"  Total ingredients: {total_ingredients}")
         print(f"  Total instruction steps: {total_steps}")
-        print(f"  Avg ingredients per recipe: {total_ingredients / len(recipes):.1f}")
-        print(f"  Avg steps per recipe: {total_steps / len(recipes):.1f}")
+        print(f"  Avg ingredients per recipe: {total_ingredients / total:.1f}")
+        print(f"  Avg steps per recipe: {total_steps / total:.1f}")
         
-    except json.JSONDecodeError as e:
+    except _JSON_ERRORS as e:
         print(f"❌ Invalid JSON: {e}")
     except Exception as e:
         print(f"❌ Error validating: {e}")
@@ -390,6 +663,9 @@ Examples:
   # Convert and validate
   python pdf_to_json.py -i recipe-pdfs/ -o recipes.json --validate
   
+  # Limit conversion to 4 worker processes
+  python pdf_to_json.py -i recipe-pdfs/ -o recipes.json --jobs 4
+  
   # Validate existing JSON
   python pdf_to_json.py --validate-only recipes.json
         """
@@ -406,6 +682,13 @@ Examples:
     parser.add_argument('--validate-only', 
                         metavar='FILE',
                         help='Only validate an existing JSON file')
+    parser.add_argument('--no-cache',
+                        action='store_true',
+                        help=f'Reparse every PDF, ignoring {CACHE_FILENAME}')
+    parser.add_argument('-j', '--jobs',
+                        type=int,
+                        metavar='N',
+                        help='Number of worker processes (default: CPU count)')
     
     args = parser.parse_args()
     
@@ -418,7 +701,8 @@ Examples:
     if not args.input:
         parser.error("--input directory is required (or use --validate-only)")
     
-    process_directory(args.input, args.output)
+    process_directory(args.input, args.output, workers=args.jobs,
+                      use_cache=not args.no_cache)
     
     # Validate if requested
     if args.validate: